@@ -0,0 +1,329 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled scanners for CleanCodeZap hot loops.
+
+These are optional: core.py and utils.py fall back to the equivalent
+regular expressions when the extension is not built. The scanners run
+without the GIL, so the thread pools scan files in parallel.
+"""
+
+from libc.stdlib cimport free, realloc
+from libc.string cimport memchr, memcmp
+
+
+cdef inline bint _is_blank(unsigned char c) nogil:
+    return c == 32 or c == 9  # ' ' or '\t'
+
+
+cdef inline bint _is_name_start(unsigned char c) nogil:
+    return (65 <= c <= 90) or (97 <= c <= 122) or c == 95  # A-Z, a-z, '_'
+
+
+cdef inline bint _is_code_char(unsigned char c) nogil:
+    # '=', '(', ')', '[', ']', '{', '}'
+    return c == 61 or c == 40 or c == 41 or c == 91 or c == 93 or c == 123 or c == 125
+
+
+cpdef int count_commented_lines(const unsigned char[:] buf, bytes marker, int limit=-1):
+    """
+    Count lines that look like commented-out code.
+
+    A line matches when, after optional blanks, it starts with ``marker``
+    followed by optional blanks, a name character and later on the same
+    line one of ``=()[]{}`` (the same rule as the regex fallback).
+
+    Args:
+        buf: File contents (bytes, bytearray or mmap)
+        marker: Comment marker, e.g. b'#' or b'//'
+        limit: Stop counting once this many lines matched (-1 for no limit)
+
+    Returns:
+        Number of matching lines
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t m = len(marker)
+    cdef const unsigned char* mk = marker
+    cdef Py_ssize_t i = 0, j, k
+    cdef int count = 0
+    cdef bint matched
+
+    with nogil:
+        while i < n:
+            j = i
+            matched = False
+
+            while j < n and _is_blank(buf[j]):
+                j += 1
+
+            if j + m <= n:
+                k = 0
+                while k < m and buf[j + k] == mk[k]:
+                    k += 1
+
+                if k == m:
+                    j += m
+                    while j < n and _is_blank(buf[j]):
+                        j += 1
+
+                    if j < n and _is_name_start(buf[j]):
+                        j += 1
+                        while j < n and buf[j] != 10:
+                            if _is_code_char(buf[j]):
+                                matched = True
+                                break
+                            j += 1
+
+            if matched:
+                count += 1
+                if 0 <= limit <= count:
+                    break
+
+            # Move on to the start of the next line
+            while j < n and buf[j] != 10:
+                j += 1
+            i = j + 1
+
+    return count
+
+
+cdef inline bint _is_space(unsigned char c) nogil:
+    return c == 32 or 9 <= c <= 13  # ' ', '\t', '\n', '\v', '\f', '\r'
+
+
+cdef inline bint _is_word(unsigned char c) nogil:
+    return _is_name_start(c) or 48 <= c <= 57  # A-Z, a-z, '_', 0-9
+
+
+cdef inline bint _is_quote(unsigned char c) nogil:
+    return c == 39 or c == 34  # '\'' or '"'
+
+
+cdef inline bint _is_clause_char(unsigned char c) nogil:
+    # Names, whitespace, '$', '*', '{', '}', ','
+    return _is_word(c) or _is_space(c) or c == 36 or c == 42 or c == 123 or c == 125 or c == 44
+
+
+cdef inline bint _is_boundary(const unsigned char* s, Py_ssize_t n, Py_ssize_t i) nogil:
+    # Same as \b: a word character on exactly one side of position i
+    return (i > 0 and _is_word(s[i - 1])) != (i < n and _is_word(s[i]))
+
+
+cdef inline bint _has_word(const unsigned char* s, Py_ssize_t n, Py_ssize_t i,
+                           const char* word, Py_ssize_t m) nogil:
+    return i + m <= n and memcmp(s + i, word, m) == 0
+
+
+cdef inline bint _is_import_keyword(const unsigned char* s, Py_ssize_t n, Py_ssize_t i) nogil:
+    # \bimport\b
+    return _is_boundary(s, n, i) and _has_word(s, n, i, b"import", 6) and _is_boundary(s, n, i + 6)
+
+
+cdef inline Py_ssize_t _skip_spaces(const unsigned char* s, Py_ssize_t n, Py_ssize_t i) nogil:
+    while i < n and _is_space(s[i]):
+        i += 1
+    return i
+
+
+cdef inline Py_ssize_t _find_byte(const unsigned char* s, Py_ssize_t start, Py_ssize_t stop,
+                                  unsigned char c) nogil:
+    cdef const unsigned char* found
+    if start >= stop:
+        return -1
+    found = <const unsigned char*>memchr(s + start, c, stop - start)
+    return found - s if found != NULL else -1
+
+
+cdef Py_ssize_t _quoted_name(const unsigned char* s, Py_ssize_t n, Py_ssize_t i) nogil:
+    # ['"]([^'"\s]+)['"] at i: the end of the name, or -1
+    cdef Py_ssize_t j = i + 1
+    if i >= n or not _is_quote(s[i]):
+        return -1
+    while j < n and not _is_quote(s[j]) and not _is_space(s[j]):
+        j += 1
+    if j == i + 1 or j >= n or not _is_quote(s[j]):
+        return -1
+    return j
+
+
+cdef struct _Spans:
+    Py_ssize_t* data
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef bint _add_span(_Spans* spans, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t* data
+    if spans.size + 2 > spans.capacity:
+        data = <Py_ssize_t*>realloc(spans.data, (spans.capacity * 2 + 16) * sizeof(Py_ssize_t))
+        if data == NULL:
+            return False
+        spans.data = data
+        spans.capacity = spans.capacity * 2 + 16
+    spans.data[spans.size] = start
+    spans.data[spans.size + 1] = end
+    spans.size += 2
+    return True
+
+
+cdef list _take_spans(_Spans* spans, bint complete):
+    cdef Py_ssize_t i
+    cdef list result = []
+    try:
+        if not complete:
+            raise MemoryError()
+        for i in range(0, spans.size, 2):
+            result.append((spans.data[i], spans.data[i + 1]))
+    finally:
+        free(spans.data)
+    return result
+
+
+cpdef list js_import_spans(const unsigned char[:] buf):
+    """
+    Find the modules of require/import statements in JavaScript source.
+
+    Matches exactly what the regex fallback matches: ``require('x')``,
+    ``import ... from 'x'`` (the clause made of names, braces, commas and
+    '*', ending at the next ``import``) and ``import 'x'``.
+
+    Args:
+        buf: File contents (bytes, bytearray or mmap)
+
+    Returns:
+        (start, end) offsets of each module name, in source order
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef const unsigned char* s
+    cdef Py_ssize_t i = 0, j, name_end, match_end
+    cdef _Spans spans = _Spans(NULL, 0, 0)
+    cdef bint complete = True
+
+    if n == 0:
+        return []
+    s = &buf[0]
+
+    with nogil:
+        while i < n:
+            match_end = -1
+
+            if s[i] == 114 and _has_word(s, n, i, b"require", 7):  # 'r'
+                # require\s*\(\s*'x'\s*\)
+                j = _skip_spaces(s, n, i + 7)
+                if j < n and s[j] == 40:  # '('
+                    j = _skip_spaces(s, n, j + 1)
+                    name_end = _quoted_name(s, n, j)
+                    if name_end != -1:
+                        match_end = _skip_spaces(s, n, name_end + 1)
+                        if match_end < n and s[match_end] == 41:  # ')'
+                            match_end += 1
+                        else:
+                            match_end = -1
+
+            elif s[i] == 105 and _is_import_keyword(s, n, i):  # 'i'
+                # import <clause> from 'x', trying the shortest clause first
+                j = i + 6
+                while True:
+                    if _is_boundary(s, n, j) and _has_word(s, n, j, b"from", 4):
+                        name_end = _quoted_name(s, n, _skip_spaces(s, n, j + 4))
+                        if name_end != -1:
+                            j = _skip_spaces(s, n, j + 4)
+                            match_end = name_end + 1
+                            break
+                    if j >= n or not _is_clause_char(s[j]) or _is_import_keyword(s, n, j):
+                        break
+                    j += 1
+
+            if match_end == -1 and s[i] == 105 and _is_boundary(s, n, i) \
+                    and _has_word(s, n, i, b"import", 6):
+                # import 'x'
+                j = _skip_spaces(s, n, i + 6)
+                name_end = _quoted_name(s, n, j)
+                if name_end != -1:
+                    match_end = name_end + 1
+
+            if match_end == -1:
+                i += 1
+                continue
+
+            if not _add_span(&spans, j + 1, name_end):
+                complete = False
+                break
+            i = match_end
+
+    return _take_spans(&spans, complete)
+
+
+cpdef list go_import_spans(const unsigned char[:] buf):
+    """
+    Find the paths of import statements in Go source.
+
+    Follows the regex fallback: the paths of the first ``import (`` block
+    when the source has one, otherwise those of ``import "x"`` lines.
+
+    Args:
+        buf: File contents (bytes, bytearray or mmap)
+
+    Returns:
+        (start, end) offsets of each import path, in source order
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef const unsigned char* s
+    cdef Py_ssize_t i = 0, j, k, stop
+    cdef _Spans spans = _Spans(NULL, 0, 0)
+    cdef bint complete = True, has_block = False
+
+    if n == 0:
+        return []
+    s = &buf[0]
+
+    with nogil:
+        while i < n and not has_block:
+            has_block = _has_word(s, n, i, b"import (", 8)
+            i += 1
+
+        i = 0
+        while i < n:
+            if not (s[i] == 105 and _has_word(s, n, i, b"import", 6)):  # 'i'
+                i += 1
+                continue
+
+            j = _skip_spaces(s, n, i + 6)
+            if j == i + 6 or j >= n or s[j] != (40 if has_block else 34):  # '(' or '"'
+                i += 1
+                continue
+
+            # Without a closing ')' or '"' after this one, no later statement matches either
+            stop = _find_byte(s, j + 1, n, 41 if has_block else 34)
+            if stop == -1:
+                break
+            if stop == j + 1:
+                i += 1
+                continue
+
+            if not has_block:
+                # import\s+"([^"]+)"
+                if not _add_span(&spans, j + 1, stop):
+                    complete = False
+                    break
+                i = stop + 1
+                continue
+
+            # import\s+\(([^)]+)\): every "([^"]+)" inside the first block
+            k = j + 1
+            while k < stop:
+                if s[k] != 34:
+                    k += 1
+                    continue
+                j = _find_byte(s, k + 1, stop, 34)
+                if j == -1:
+                    break
+                if j == k + 1:
+                    k = j
+                    continue
+                if not _add_span(&spans, k + 1, j):
+                    complete = False
+                    break
+                k = j + 1
+            break
+
+    return _take_spans(&spans, complete)
@@ -7,9 +7,8 @@ import os
 import sys
 import click
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, TYPE_CHECKING
 
-from .core import CodeCleaner
 from .utils import (
     detect_project_language, 
     validate_project_path,
@@ -19,6 +18,44 @@ from .utils import (
     print_warning
 )
 
+if TYPE_CHECKING:
+    from .core import CodeCleaner
+
+
+def _prepare(path: str, lang: str, jobs: Optional[int] = None,
+             daemon: bool = False) -> Tuple[Path, str, 'CodeCleaner']:
+    """
+    Resolve the project path and language and create a cleaner for them.
+    
+    Exits with an error message if the path is invalid or the language
+    cannot be detected.
+    
+    Args:
+        path: Project path given on the command line
+        lang: Language given on the command line, or 'auto'
+        jobs: Maximum number of files processed in parallel
+        daemon: Whether to use blackd/eslint_d servers when installed
+        
+    Returns:
+        Tuple of (project path, language, CodeCleaner)
+    """
+    from .core import CodeCleaner
+    
+    project_path = Path(path).resolve()
+    if not validate_project_path(project_path):
+        print_error(f"Путь не найден или недоступен: {project_path}")
+        sys.exit(1)
+    
+    if lang == 'auto':
+        detected_lang = detect_project_language(project_path, workers=jobs or 1)
+        if not detected_lang:
+            print_error("Не удалось определить язык проекта. Попробуйте указать --lang явно.")
+            sys.exit(1)
+        lang = detected_lang
+        print_info(f"Автоматически определен язык: {lang}")
+    
+    return project_path, lang, CodeCleaner(project_path, lang, jobs=jobs, use_daemons=daemon)
+
 
 @click.group(invoke_without_command=True)
 @click.option('--version', is_flag=True, help='Show version information')
@@ -44,25 +81,16 @@ def cli(ctx, version):
 @click.option('--lang', '-l', type=click.Choice(['python', 'javascript', 'go', 'auto']), 
               default='auto', help='Язык проекта (по умолчанию: автоопределение)')
 @click.option('--dry-run', is_flag=True, help='Показать изменения без их применения')
-def check(path, lang, dry_run):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Количество файлов, обрабатываемых параллельно (по умолчанию: число ядер CPU)')
+@click.option('--daemon', is_flag=True,
+              help='Использовать серверы blackd/eslint_d, если они установлены')
+def check(path, lang, dry_run, jobs, daemon):
     """
     Проверяет проект и показывает, что будет очищено.
     """
     try:
-        project_path = Path(path).resolve()
-        if not validate_project_path(project_path):
-            print_error(f"Путь не найден или недоступен: {project_path}")
-            sys.exit(1)
-        
-        if lang == 'auto':
-            detected_lang = detect_project_language(project_path)
-            if not detected_lang:
-                print_error("Не удалось определить язык проекта. Попробуйте указать --lang явно.")
-                sys.exit(1)
-            lang = detected_lang
-            print_info(f"Автоматически определен язык: {lang}")
-        
-        cleaner = CodeCleaner(project_path, lang)
+        project_path, lang, cleaner = _prepare(path, lang, jobs, daemon)
         
         print_info(f"Анализ проекта: {project_path}")
         print_info(f"Язык: {lang}")
@@ -93,25 +121,16 @@ def check(path, lang, dry_run):
               default='auto', help='Язык проекта (по умолчанию: автоопределение)')
 @click.option('--backup', is_flag=True, help='Создать резервную копию перед изменениями')
 @click.option('--aggressive', is_flag=True, help='Агрессивная очистка (может потребовать проверки)')
-def fix(path, lang, backup, aggressive):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Количество файлов, обрабатываемых параллельно (по умолчанию: число ядер CPU)')
+@click.option('--daemon', is_flag=True,
+              help='Использовать серверы blackd/eslint_d, если они установлены')
+def fix(path, lang, backup, aggressive, jobs, daemon):
     """
     Исправляет найденные проблемы в проекте.
     """
     try:
-        project_path = Path(path).resolve()
-        if not validate_project_path(project_path):
-            print_error(f"Путь не найден или недоступен: {project_path}")
-            sys.exit(1)
-        
-        if lang == 'auto':
-            detected_lang = detect_project_language(project_path)
-            if not detected_lang:
-                print_error("Не удалось определить язык проекта. Попробуйте указать --lang явно.")
-                sys.exit(1)
-            lang = detected_lang
-            print_info(f"Автоматически определен язык: {lang}")
-        
-        cleaner = CodeCleaner(project_path, lang)
+        project_path, lang, cleaner = _prepare(path, lang, jobs, daemon)
         
         print_info(f"Оптимизация проекта: {project_path}")
         print_info(f"Язык: {lang}")
@@ -144,25 +163,16 @@ def fix(path, lang, backup, aggressive):
 @click.option('--path', '-p', default='.', help='Путь к проекту (по умолчанию: текущая директория)')
 @click.option('--lang', '-l', type=click.Choice(['python', 'javascript', 'go', 'auto']), 
               default='auto', help='Язык проекта (по умолчанию: автоопределение)')
-def format(path, lang):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Количество файлов, обрабатываемых параллельно (по умолчанию: число ядер CPU)')
+@click.option('--daemon', is_flag=True,
+              help='Использовать серверы blackd/eslint_d, если они установлены')
+def format(path, lang, jobs, daemon):
     """
     Форматирует код проекта согласно стандартам языка.
     """
     try:
-        project_path = Path(path).resolve()
-        if not validate_project_path(project_path):
-            print_error(f"Путь не найден или недоступен: {project_path}")
-            sys.exit(1)
-        
-        if lang == 'auto':
-            detected_lang = detect_project_language(project_path)
-            if not detected_lang:
-                print_error("Не удалось определить язык проекта. Попробуйте указать --lang явно.")
-                sys.exit(1)
-            lang = detected_lang
-            print_info(f"Автоматически определен язык: {lang}")
-        
-        cleaner = CodeCleaner(project_path, lang)
+        project_path, lang, cleaner = _prepare(path, lang, jobs, daemon)
         
         print_info(f"Форматирование проекта: {project_path}")
         print_info(f"Язык: {lang}")
@@ -191,20 +201,7 @@ def deps(path, lang, remove_unused):
     Анализирует зависимости проекта и показывает неиспользуемые/устаревшие.
     """
     try:
-        project_path = Path(path).resolve()
-        if not validate_project_path(project_path):
-            print_error(f"Путь не найден или недоступен: {project_path}")
-            sys.exit(1)
-        
-        if lang == 'auto':
-            detected_lang = detect_project_language(project_path)
-            if not detected_lang:
-                print_error("Не удалось определить язык проекта. Попробуйте указать --lang явно.")
-                sys.exit(1)
-            lang = detected_lang
-            print_info(f"Автоматически определен язык: {lang}")
-        
-        cleaner = CodeCleaner(project_path, lang)
+        project_path, lang, cleaner = _prepare(path, lang)
         
         print_info(f"Анализ зависимостей: {project_path}")
         print_info(f"Язык: {lang}")
@@ -4,59 +4,141 @@ Core functionality for CleanCodeZap.
 
 import os
 import re
-import json
+import atexit
+import hashlib
+import mmap
 import shutil
-import tempfile
+import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Set, Optional, Any, Callable, Iterable, Iterator, Pattern
 
 from .utils import (
-    find_files_by_extension,
+    iter_files_by_extension,
     is_binary_file,
     run_command,
     check_tool_availability,
     extract_imports_from_python_file,
     extract_requires_from_js_file,
     extract_imports_from_go_file,
-    backup_file,
+    extract_imports_per_file,
+    backup_files,
     create_gitignore_if_missing
 )
 
+try:
+    from ._scanners import count_commented_lines
+except ImportError:  # Compiled extension not built, use the regex fallback
+    count_commented_lines = None
+
+
+# Maximum number of files passed to a single tool invocation (keeps argv under ARG_MAX)
+BATCH_SIZE = 500
+
+# Parsing imports is CPU-bound, so large batches of files are parsed in worker processes
+PROCESS_POOL_MIN_FILES = 128
+
+# Directory (inside the project) holding per-file analysis results between runs
+CACHE_DIR_NAME = '.cleancodezap_cache'
+
+# Version of the cache index layout and of the extractors' results; bump it
+# whenever an extractor changes what it reports, so old entries are dropped
+CACHE_VERSION = 2
+
+# Directories that are never searched for code files
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.pytest_cache', 'venv', '.venv', CACHE_DIR_NAME
+})
+
+# Extensions that are always text, so files with them skip the binary check
+TEXT_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.jsx', '.tsx', '.go'})
+
+# Names left out of project backups
+BACKUP_IGNORED_NAMES = frozenset({'__pycache__', 'node_modules', '.git', CACHE_DIR_NAME})
+BACKUP_IGNORED_SUFFIXES = ('.pyc', '.pyo')
+
+# Files that cleaners and formatters may rewrite in place; backups need real copies of these.
+# Everything else is hardlinked, which costs no data IO or extra disk space.
+REWRITTEN_SUFFIXES = frozenset({'.py', '.pyi', '.js', '.ts', '.jsx', '.tsx', '.go', '.json'})
+REWRITTEN_NAMES = frozenset({'requirements.txt', 'setup.py', 'pyproject.toml', 'go.mod', 'go.sum'})
+
+# A file with more commented-out lines than this is reported
+COMMENTED_CODE_THRESHOLD = 2
+
+# Files smaller than this are read in one call; mapping them costs more than it saves
+MMAP_MIN_SIZE = 64 * 1024
+
+# Comment markers understood by the compiled commented-code scanner
+_COMMENT_MARKERS = {'python': b'#', 'javascript': b'//', 'go': b'//'}
+
+# Separates a requirement's package name from its version specifier
+_VERSION_SPLIT = re.compile(r'[>=<~!]')
+
+# Lines that look like commented-out code, matched over the whole file at once
+_COMMENTED_CODE_RE = {
+    'python': re.compile(rb'^[ \t]*#[ \t]*[a-zA-Z_].*[=()\[\]{}]', re.MULTILINE),
+    'javascript': re.compile(rb'^[ \t]*//[ \t]*[a-zA-Z_].*[=()\[\]{}]', re.MULTILINE),
+    'go': re.compile(rb'^[ \t]*//[ \t]*[a-zA-Z_].*[=()\[\]{}]', re.MULTILINE),
+}
+
 
 class CodeCleaner:
     """
     Main class for cleaning and optimizing code projects.
     """
     
-    def __init__(self, project_path: Path, language: str):
+    def __init__(self, project_path: Path, language: str, jobs: Optional[int] = None,
+                 use_daemons: bool = False):
         """
         Initialize the code cleaner.
         
         Args:
             project_path: Path to the project directory
             language: Programming language ('python', 'javascript', 'go')
+            jobs: Maximum number of files processed in parallel (defaults to CPU count)
+            use_daemons: Use long-lived tool servers (blackd, eslint_d) when installed
         """
         self.project_path = project_path
         self.language = language
+        self.jobs = jobs or os.cpu_count() or 1
+        self.use_daemons = use_daemons
         self.backup_dir = None
         
+        # blackd server started on first use when use_daemons is set
+        self._blackd_lock = threading.Lock()
+        self._blackd_started = False
+        self._blackd_url: Optional[str] = None
+        self._blackd_opener = None
+        
+        # Code files found by the first project walk, reused by later passes
+        self._code_files_cache: Optional[List[Path]] = None
+        
+        # Content-addressed cache of extracted imports, loaded on first use
+        self._cache_dir = project_path / CACHE_DIR_NAME
+        self._cache = None
+        self._cache_dirty = False
+        
         # Language-specific configurations
         self.config = {
             'python': {
-                'extensions': ['.py'],
+                'extensions': frozenset({'.py'}),
                 'dependency_files': ['requirements.txt', 'setup.py', 'pyproject.toml'],
                 'formatter': 'black',
                 'cleaner': 'autoflake'
             },
             'javascript': {
-                'extensions': ['.js', '.ts', '.jsx', '.tsx'],
+                'extensions': frozenset({'.js', '.ts', '.jsx', '.tsx'}),
                 'dependency_files': ['package.json'],
                 'formatter': 'prettier',
                 'cleaner': 'eslint'
             },
             'go': {
-                'extensions': ['.go'],
+                'extensions': frozenset({'.go'}),
                 'dependency_files': ['go.mod'],
                 'formatter': 'gofmt',
                 'cleaner': 'go'
@@ -78,20 +160,14 @@ class CodeCleaner:
             issues.append("No project files found, check the path")
             return issues
         
-        # Check for unused imports
-        unused_imports = self._find_unused_imports(files)
-        if unused_imports:
-            issues.append(f"Found {len(unused_imports)} files with unused imports")
-        
-        # Check for commented code
-        commented_code = self._find_commented_code(files)
-        if commented_code:
-            issues.append(f"Found {len(commented_code)} files with commented-out code")
-        
-        # Check for formatting issues
-        formatting_issues = self._check_formatting(files)
-        if formatting_issues:
-            issues.append(f"Found {len(formatting_issues)} files with formatting issues")
+        # Check for unused imports, commented code and formatting in a single pass
+        report = self._scan_files(files)
+        if report['unused_imports']:
+            issues.append(f"Found {len(report['unused_imports'])} files with unused imports")
+        if report['commented_code']:
+            issues.append(f"Found {len(report['commented_code'])} files with commented-out code")
+        if report['formatting']:
+            issues.append(f"Found {len(report['formatting'])} files with formatting issues")
         
         # Check dependencies
         dependency_issues = self._check_dependencies()
@@ -124,9 +200,10 @@ class CodeCleaner:
         if not files:
             return results
         
-        for file_path in files:
-            if self._clean_file(file_path, aggressive):
-                results['files_processed'] += 1
+        cleaned = self._parallel_files(
+            self._chunk_files(files), partial(self._clean_chunk, aggressive=aggressive)
+        )
+        results['files_processed'] = sum(cleaned)
         
         # Clean dependencies if requested
         if aggressive:
@@ -153,26 +230,31 @@ class CodeCleaner:
         
         formatter = self.config[self.language]['formatter']
         
-        if self.language == 'python' and check_tool_availability('black'):
-            result = run_command(['black', '--check', '--diff', str(self.project_path)])
+        if self.language == 'python' and self._start_blackd():
+            formatted = self._parallel_files(files, partial(self._blackd_format, write=True))
+            results['files_formatted'] = sum(bool(changed) for changed in formatted)
+            
+            # blackd went away: format the files it did not reach with the command line tool
+            unreached = [
+                file_path for file_path, changed in zip(files, formatted) if changed is None
+            ]
+            if unreached and check_tool_availability('black'):
+                for chunk in self._chunk_files(unreached):
+                    result = run_command(['black'] + [str(file_path) for file_path in chunk])
+                    results['files_formatted'] += sum(
+                        line.startswith('reformatted ') for line in result['stderr'].splitlines()
+                    )
+        
+        elif self.language == 'python' and check_tool_availability('black'):
+            result = run_command(['black', '--check', str(self.project_path)])
             if not result['success']:
                 # Format the files
                 run_command(['black', str(self.project_path)])
                 results['files_formatted'] = len(files)
         
-        elif self.language == 'javascript' and check_tool_availability('prettier'):
-            for file_path in files:
-                result = run_command(['prettier', '--check', str(file_path)])
-                if not result['success']:
-                    run_command(['prettier', '--write', str(file_path)])
-                    results['files_formatted'] += 1
-        
-        elif self.language == 'go' and check_tool_availability('gofmt'):
-            for file_path in files:
-                result = run_command(['gofmt', '-l', str(file_path)])
-                if result['stdout'].strip():
-                    run_command(['gofmt', '-w', str(file_path)])
-                    results['files_formatted'] += 1
+        elif self.language in ('javascript', 'go') and check_tool_availability(formatter):
+            formatted = self._parallel_files(self._chunk_files(files), self._format_files)
+            results['files_formatted'] = sum(formatted)
         
         return results
     
@@ -214,107 +296,316 @@ class CodeCleaner:
         Returns:
             Path to the backup directory
         """
+        from datetime import datetime
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.backup_dir = self.project_path.parent / f"backup_{self.project_path.name}_{timestamp}"
         
-        # Copy the entire project
-        shutil.copytree(self.project_path, self.backup_dir, ignore=shutil.ignore_patterns(
-            '__pycache__', 'node_modules', '.git', '*.pyc', '*.pyo'
-        ))
+        # (source, path relative to the backup) of files that need a real copy
+        copies = []
+        # (source, backup) directories, parents before their subdirectories
+        directories = []
         
+        os.makedirs(self.backup_dir)
+        for dirpath, dirnames, filenames in os.walk(self.project_path, followlinks=True):
+            dirnames[:] = [name for name in dirnames if name not in BACKUP_IGNORED_NAMES]
+            
+            relative_dir = os.path.relpath(dirpath, self.project_path)
+            target_dir = self.backup_dir / relative_dir
+            os.makedirs(target_dir, exist_ok=True)
+            directories.append((dirpath, target_dir))
+            
+            for name in filenames:
+                if name in BACKUP_IGNORED_NAMES or name.endswith(BACKUP_IGNORED_SUFFIXES):
+                    continue
+                
+                src = os.path.join(dirpath, name)
+                if name in REWRITTEN_NAMES or os.path.splitext(name)[1] in REWRITTEN_SUFFIXES:
+                    copies.append((src, os.path.join(relative_dir, name)))
+                    continue
+                
+                try:
+                    os.link(src, target_dir / name)
+                except OSError:
+                    # Cross-device backup or no hardlink support on this filesystem
+                    copies.append((src, os.path.join(relative_dir, name)))
+        
+        backup_files(copies, self.backup_dir)
+        
+        # Keep directory modes and times like copytree did, deepest first so that
+        # filling a subdirectory does not reset its parent's mtime afterwards
+        for dirpath, target_dir in reversed(directories):
+            shutil.copystat(dirpath, target_dir)
         return self.backup_dir
     
     def _get_code_files(self) -> List[Path]:
-        """Get list of code files in the project."""
-        extensions = self.config[self.language]['extensions']
-        files = find_files_by_extension(self.project_path, extensions)
+        """Get list of code files in the project (the project is walked only once)."""
+        if self._code_files_cache is None:
+            self._code_files_cache = list(self._iter_code_files())
         
-        # Filter out binary files and files in ignored directories
-        ignored_dirs = {'.git', '__pycache__', 'node_modules', '.pytest_cache', 'venv', '.venv'}
+        return self._code_files_cache
+    
+    def _iter_code_files(self) -> Iterator[Path]:
+        """Yield code files as the walk finds them (or from the list of an earlier walk)."""
+        if self._code_files_cache is not None:
+            yield from self._code_files_cache
+            return
         
-        filtered_files = []
-        for file_path in files:
-            # Check if file is in an ignored directory
-            if any(ignored_dir in file_path.parts for ignored_dir in ignored_dirs):
-                continue
-            
-            # Check if file is binary
-            if is_binary_file(file_path):
-                continue
-            
-            filtered_files.append(file_path)
+        extensions = self.config[self.language]['extensions']
+        for file_path in iter_files_by_extension(self.project_path, extensions, IGNORED_DIRS):
+            # Filter out binary files (ignored directories are already pruned from the walk)
+            if file_path.suffix in TEXT_EXTENSIONS or not is_binary_file(file_path):
+                yield file_path
+    
+    def _invalidate_code_files(self) -> None:
+        """Forget the cached code file list, e.g. after files were added or removed."""
+        self._code_files_cache = None
+    
+    def _parallel_files(self, items: List[Any], fn: Callable[[Any], Any]) -> List[Any]:
+        """Apply ``fn`` to every file or batch, running up to ``self.jobs`` calls at once."""
+        if self.jobs <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        
+        # Threads are enough here: the work is waiting on external tools
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(items))) as executor:
+            return list(executor.map(fn, items))
+    
+    def _chunk_files(self, files: List[Path]) -> List[List[Path]]:
+        """Split files into batches for tool invocations, one or more per worker."""
+        size = min(BATCH_SIZE, max(1, -(-len(files) // self.jobs)))
+        return [files[i:i + size] for i in range(0, len(files), size)]
+    
+    def _scan_files(self, files: List[Path]) -> Dict[str, List[Path]]:
+        """Collect unused imports, commented code and formatting issues in one traversal."""
+        report = {'unused_imports': [], 'commented_code': [], 'formatting': []}
+        
+        for chunk_report in self._parallel_files(self._chunk_files(files), self._scan_chunk):
+            for key, chunk_files in chunk_report.items():
+                report[key].extend(chunk_files)
         
-        return filtered_files
+        return report
+    
+    def _scan_chunk(self, files: List[Path]) -> Dict[str, List[Path]]:
+        """Run every per-file check on a batch of files."""
+        return {
+            'unused_imports': self._unused_imports_in(files),
+            'commented_code': self._commented_code_in(files),
+            'formatting': self._formatting_issues_in(files),
+        }
     
     def _find_unused_imports(self, files: List[Path]) -> List[Path]:
         """Find files with unused imports."""
         files_with_unused = []
-        
-        for file_path in files:
-            if self.language == 'python':
-                # Use autoflake to check for unused imports
-                if check_tool_availability('autoflake'):
-                    result = run_command([
-                        'autoflake', '--check', '--remove-unused-variables',
-                        '--remove-all-unused-imports', str(file_path)
-                    ])
-                    if not result['success'] and 'would be reformatted' in result['stderr']:
-                        files_with_unused.append(file_path)
+        for chunk_unused in self._parallel_files(self._chunk_files(files), self._unused_imports_in):
+            files_with_unused.extend(chunk_unused)
         
         return files_with_unused
     
-    def _find_commented_code(self, files: List[Path]) -> List[Path]:
-        """Find files with commented-out code."""
-        files_with_comments = []
+    def _unused_imports_in(self, files: List[Path]) -> List[Path]:
+        """Check a batch of files for unused imports with a single autoflake run."""
+        if self.language != 'python' or not check_tool_availability('autoflake'):
+            return []
         
-        comment_patterns = {
-            'python': r'^\s*#\s*[a-zA-Z_].*[=\(\)\[\]{}]',
-            'javascript': r'^\s*//\s*[a-zA-Z_].*[=\(\)\[\]{}]',
-            'go': r'^\s*//\s*[a-zA-Z_].*[=\(\)\[\]{}]'
-        }
+        result = run_command([
+            'autoflake', '--check', '--remove-unused-variables',
+            '--remove-all-unused-imports'
+        ] + [str(file_path) for file_path in files])
+        if result['success']:
+            return []
+        
+        # autoflake reports "<file>: Unused imports/variables detected"
+        message = 'Unused imports/variables detected'
+        suffix = ': ' + message
+        reported = [
+            line[:-len(suffix)] for line in result['stdout'].splitlines() if line.endswith(suffix)
+        ]
+        if reported:
+            return self._match_reported_files(files, reported)
         
-        pattern = comment_patterns.get(self.language)
+        # Older autoflake releases print the message without the file name
+        if len(files) == 1:
+            return list(files) if message in result['stdout'] else []
+        return [file_path for file_path in files if self._unused_imports_in([file_path])]
+    
+    def _find_commented_code(self, files: List[Path]) -> List[Path]:
+        """Find files with commented-out code."""
+        return self._commented_code_in(files)
+    
+    def _commented_code_in(self, files: List[Path]) -> List[Path]:
+        """Check a batch of files for commented-out code."""
+        pattern = _COMMENTED_CODE_RE.get(self.language)
         if not pattern:
-            return files_with_comments
+            return []
         
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                commented_lines = 0
-                for line in content.split('\n'):
-                    if re.match(pattern, line):
-                        commented_lines += 1
+        return [file_path for file_path in files if self._has_commented_code(file_path, pattern)]
+    
+    def _has_commented_code(self, file_path: Path, pattern: Pattern[bytes]) -> bool:
+        """Check a file for commented-out code, stopping as soon as the threshold is passed."""
+        limit = COMMENTED_CODE_THRESHOLD + 1
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                    return self._count_commented_lines(f.read(), pattern, limit) >= limit
                 
-                if commented_lines > 2:  # Threshold for commented code
-                    files_with_comments.append(file_path)
-            except (OSError, UnicodeDecodeError):
-                continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return self._count_commented_lines(content, pattern, limit) >= limit
+        except (OSError, ValueError):  # ValueError: file emptied before it could be mapped
+            return False
+    
+    def _count_commented_lines(self, content: Any, pattern: Pattern[bytes], limit: int) -> int:
+        """Count commented-out code lines in a bytes-like buffer, up to ``limit``."""
+        if count_commented_lines is not None:
+            return count_commented_lines(content, _COMMENT_MARKERS[self.language], limit)
         
-        return files_with_comments
+        return sum(1 for _ in islice(pattern.finditer(content), limit))
     
     def _check_formatting(self, files: List[Path]) -> List[Path]:
         """Check files for formatting issues."""
         files_with_issues = []
+        chunks = self._chunk_files(files)
+        for chunk_issues in self._parallel_files(chunks, self._formatting_issues_in):
+            files_with_issues.extend(chunk_issues)
         
-        for file_path in files:
-            if self.language == 'python' and check_tool_availability('black'):
-                result = run_command(['black', '--check', str(file_path)])
-                if not result['success']:
-                    files_with_issues.append(file_path)
+        return files_with_issues
+    
+    def _formatting_issues_in(self, files: List[Path]) -> List[Path]:
+        """Check a batch of files for formatting issues with a single formatter run."""
+        paths = [str(file_path) for file_path in files]
+        
+        if self.language == 'python' and self._start_blackd():
+            checked = [(file_path, self._blackd_format(file_path)) for file_path in files]
+            if all(changed is not None for _, changed in checked):
+                return [file_path for file_path, changed in checked if changed]
+            # blackd went away; fall through to the command line tool
+        
+        if self.language == 'python' and check_tool_availability('black'):
+            result = run_command(['black', '--check'] + paths)
+            if result['success']:
+                return []
+            # black reports "would reformat <file>" and, for files it cannot handle,
+            # "error: ..." lines whose layout differs between black releases
+            reported = [
+                line for line in result['stderr'].splitlines()
+                if line.startswith(('would reformat ', 'error: '))
+            ]
+            return [
+                file_path for file_path in files
+                if any(str(file_path) in line for line in reported)
+            ]
+        
+        elif self.language == 'javascript' and check_tool_availability('prettier'):
+            result = run_command(['prettier', '--list-different'] + paths)
+            return self._match_reported_files(files, result['stdout'].splitlines())
+        
+        elif self.language == 'go' and check_tool_availability('gofmt'):
+            result = run_command(['gofmt', '-l'] + paths)
+            return self._match_reported_files(files, result['stdout'].splitlines())
+        
+        return []
+    
+    def _start_blackd(self) -> Optional[str]:
+        """Start this cleaner's blackd server on first use and return its URL."""
+        with self._blackd_lock:
+            if self._blackd_started:
+                return self._blackd_url
+            self._blackd_started = True
+            
+            if not (self.use_daemons and check_tool_availability('blackd')):
+                return None
+            
+            # Imported here: the daemon is opt-in, and urllib.request is slow to import
+            import socket
+            import urllib.request
+            
+            # Let the OS pick a free port
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
             
-            elif self.language == 'javascript' and check_tool_availability('prettier'):
-                result = run_command(['prettier', '--check', str(file_path)])
-                if not result['success']:
-                    files_with_issues.append(file_path)
+            try:
+                process = subprocess.Popen(
+                    ['blackd', '--bind-host', '127.0.0.1', '--bind-port', str(port)],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                return None
+            atexit.register(process.terminate)
+            
+            # Wait until the server accepts connections
+            deadline = time.monotonic() + 10
+            while process.poll() is None and time.monotonic() < deadline:
+                try:
+                    socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                except OSError:
+                    time.sleep(0.05)
+                    continue
+                
+                # Talk to the local server directly, never through the user's HTTP proxy
+                self._blackd_opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+                self._blackd_url = f'http://127.0.0.1:{port}/'
+                return self._blackd_url
             
-            elif self.language == 'go' and check_tool_availability('gofmt'):
-                result = run_command(['gofmt', '-l', str(file_path)])
-                if result['stdout'].strip():
-                    files_with_issues.append(file_path)
+            process.terminate()
+            return None
+    
+    def _blackd_format(self, file_path: Path, write: bool = False) -> Optional[bool]:
+        """
+        Format a file through blackd.
         
-        return files_with_issues
+        Args:
+            file_path: Python file to format
+            write: Whether to write the formatted code back to the file
+            
+        Returns:
+            True if the file is (or was) not formatted, False if it already is,
+            None if blackd could not be reached
+        """
+        import urllib.error
+        import urllib.request
+        
+        try:
+            content = file_path.read_bytes()
+        except OSError:
+            return False
+        
+        request = urllib.request.Request(
+            self._blackd_url, data=content, headers={'X-Fast-Or-Safe': 'safe'}
+        )
+        try:
+            with self._blackd_opener.open(request, timeout=60) as response:
+                if response.status == 204:  # Already formatted
+                    return False
+                formatted = response.read()
+        except urllib.error.HTTPError:
+            # Source could not be parsed or formatted: an issue for checks, nothing to write
+            return not write
+        except OSError:
+            return None
+        
+        if write:
+            try:
+                file_path.write_bytes(formatted)
+            except OSError:
+                return False
+        return True
+    
+    def _match_reported_files(self, files: List[Path], reported: List[str]) -> List[Path]:
+        """Map file names printed by a tool back to the paths that were passed to it."""
+        by_name = {str(file_path): file_path for file_path in files}
+        return [by_name.get(name.strip(), Path(name.strip())) for name in reported if name.strip()]
+    
+    def _format_files(self, files: List[Path]) -> int:
+        """Format a batch of JavaScript/Go files, returning how many were changed."""
+        changed = [str(file_path) for file_path in self._formatting_issues_in(files)]
+        if not changed:
+            return 0
+        
+        if self.language == 'javascript':
+            run_command(['prettier', '--write'] + changed)
+        elif self.language == 'go':
+            run_command(['gofmt', '-w'] + changed)
+        
+        return len(changed)
     
     def _check_dependencies(self) -> Dict[str, List]:
         """Check for dependency issues."""
@@ -334,22 +625,33 @@ class CodeCleaner:
         
         return result
     
-    def _clean_file(self, file_path: Path, aggressive: bool) -> bool:
-        """Clean a single file."""
+    def _clean_chunk(self, files: List[Path], aggressive: bool) -> int:
+        """Clean a batch of files, returning how many were processed successfully."""
+        if self._clean_files(files, aggressive):
+            return len(files)
+        
+        if len(files) == 1:
+            return 0
+        
+        # The batch failed as a whole; retry file by file to find out which ones succeed
+        return sum(self._clean_files([file_path], aggressive) for file_path in files)
+    
+    def _clean_files(self, files: List[Path], aggressive: bool) -> bool:
+        """Clean a batch of files with a single tool invocation."""
         try:
             if self.language == 'python':
-                return self._clean_python_file(file_path, aggressive)
+                return self._clean_python_files(files, aggressive)
             elif self.language == 'javascript':
-                return self._clean_js_file(file_path, aggressive)
+                return self._clean_js_files(files, aggressive)
             elif self.language == 'go':
-                return self._clean_go_file(file_path, aggressive)
+                return self._clean_go_files(files, aggressive)
         except Exception:
             return False
         
         return False
     
-    def _clean_python_file(self, file_path: Path, aggressive: bool) -> bool:
-        """Clean a Python file."""
+    def _clean_python_files(self, files: List[Path], aggressive: bool) -> bool:
+        """Clean Python files."""
         if not check_tool_availability('autoflake'):
             return False
         
@@ -363,27 +665,31 @@ class CodeCleaner:
         if aggressive:
             command.append('--remove-duplicate-keys')
         
-        command.append(str(file_path))
+        command.extend(str(file_path) for file_path in files)
         
         result = run_command(command)
         return result['success']
     
-    def _clean_js_file(self, file_path: Path, aggressive: bool) -> bool:
-        """Clean a JavaScript/TypeScript file."""
-        # For JS, we'd typically use ESLint with --fix
-        if not check_tool_availability('eslint'):
+    def _clean_js_files(self, files: List[Path], aggressive: bool) -> bool:
+        """Clean JavaScript/TypeScript files."""
+        # For JS, we'd typically use ESLint with --fix (eslint_d is a faster drop-in server)
+        if self.use_daemons and check_tool_availability('eslint_d'):
+            eslint = 'eslint_d'
+        elif check_tool_availability('eslint'):
+            eslint = 'eslint'
+        else:
             return False
         
-        result = run_command(['eslint', '--fix', str(file_path)])
+        result = run_command([eslint, '--fix'] + [str(file_path) for file_path in files])
         return result['success'] or result['returncode'] == 1  # ESLint returns 1 for fixable issues
     
-    def _clean_go_file(self, file_path: Path, aggressive: bool) -> bool:
-        """Clean a Go file."""
+    def _clean_go_files(self, files: List[Path], aggressive: bool) -> bool:
+        """Clean Go files."""
         # Go has built-in tools
         if not check_tool_availability('goimports'):
             return False
         
-        result = run_command(['goimports', '-w', str(file_path)])
+        result = run_command(['goimports', '-w'] + [str(file_path) for file_path in files])
         return result['success']
     
     def _find_dependency_file(self) -> Optional[Path]:
@@ -403,22 +709,21 @@ class CodeCleaner:
         
         # Read requirements.txt
         try:
-            with open(dep_file, 'r', encoding='utf-8') as f:
-                requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            lines = dep_file.read_text(encoding='utf-8').splitlines()
         except OSError:
             return result
+        requirements = [line.strip() for line in lines if line.strip() and not line.startswith('#')]
         
         # Get used imports from all Python files
-        files = self._get_code_files()
-        used_imports = set()
-        for file_path in files:
-            used_imports.update(extract_imports_from_python_file(file_path))
+        files = self._iter_code_files()
+        used_imports = self._collect_imports(
+            files, extract_imports_from_python_file, use_processes=True
+        )
         
         # Check which requirements are unused
-        for req in requirements:
-            package_name = re.split('[>=<]', req)[0].strip()
-            if package_name and package_name not in used_imports:
-                result['unused_dependencies'].append(package_name)
+        package_names = {_VERSION_SPLIT.split(req, maxsplit=1)[0].strip() for req in requirements}
+        package_names.discard('')
+        result['unused_dependencies'] = sorted(package_names - used_imports)
         
         # Remove unused dependencies if requested
         if remove_unused and result['unused_dependencies']:
@@ -428,6 +733,8 @@ class CodeCleaner:
     
     def _analyze_js_dependencies(self, dep_file: Path, remove_unused: bool) -> Dict[str, Any]:
         """Analyze JavaScript dependencies."""
+        import json
+        
         result = {'unused_dependencies': [], 'outdated_dependencies': {}}
         
         try:
@@ -441,15 +748,11 @@ class CodeCleaner:
         all_deps = {**dependencies, **dev_dependencies}
         
         # Get used requires from all JS files
-        files = self._get_code_files()
-        used_requires = set()
-        for file_path in files:
-            used_requires.update(extract_requires_from_js_file(file_path))
+        files = self._iter_code_files()
+        used_requires = self._collect_imports(files, extract_requires_from_js_file)
         
         # Check which dependencies are unused
-        for dep_name in all_deps:
-            if dep_name not in used_requires:
-                result['unused_dependencies'].append(dep_name)
+        result['unused_dependencies'] = sorted(all_deps.keys() - used_requires)
         
         return result
     
@@ -478,20 +781,138 @@ class CodeCleaner:
     def _remove_unused_python_deps(self, dep_file: Path, unused_deps: List[str]) -> None:
         """Remove unused Python dependencies."""
         try:
-            with open(dep_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            lines = dep_file.read_text(encoding='utf-8').splitlines(keepends=True)
             
+            unused = set(unused_deps)
             filtered_lines = []
             for line in lines:
-                package_name = re.split('[>=<]', line.strip())[0].strip()
-                if package_name not in unused_deps:
+                package_name = _VERSION_SPLIT.split(line, maxsplit=1)[0].strip()
+                if package_name not in unused:
                     filtered_lines.append(line)
             
-            with open(dep_file, 'w', encoding='utf-8') as f:
-                f.writelines(filtered_lines)
+            dep_file.write_text(''.join(filtered_lines), encoding='utf-8')
         except OSError:
             pass
     
+    def _collect_imports(self, files: Iterable[Path], extractor: Callable[[Path], Set[str]],
+                         use_processes: bool = False) -> Set[str]:
+        """
+        Collect the imports of all files, re-extracting only files whose content changed.
+        
+        Args:
+            files: Files to collect imports from (may be a lazy walk of the project)
+            extractor: Module-level function extracting the imports of one file
+            use_processes: Whether large batches may be parsed in a process pool
+            
+        Returns:
+            Union of the imports of all files
+        """
+        cache = self._extractor_cache(extractor)
+        used_imports = set()
+        
+        # (file, cache key, fingerprint) of every file without a valid cache entry
+        misses = []
+        seen = set()
+        pending = self._uncached_files(files, cache, used_imports, misses, seen)
+        head = list(islice(pending, PROCESS_POOL_MIN_FILES))
+        
+        extracted = None
+        if use_processes and self.jobs > 1 and len(head) == PROCESS_POOL_MIN_FILES:
+            try:
+                # pool.map pulls the rest of the walk lazily, so workers start on the
+                # first batches while later files are still being discovered
+                with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                    extracted = list(pool.map(extractor, chain(head, pending), chunksize=16))
+            except (OSError, BrokenProcessPool):
+                extracted = None  # No usable worker processes here, parse in-process
+        if extracted is None:
+            for _ in pending:
+                pass  # Finish the walk; every uncached file is recorded in misses
+            # Native scanner where built, otherwise threads overlapping the reads
+            extracted = extract_imports_per_file(
+                [file_path for file_path, _, _ in misses], extractor, self.jobs
+            )
+        
+        for (file_path, key, fingerprint), imports in zip(misses, extracted):
+            used_imports.update(imports)
+            if fingerprint:
+                cache[key] = {'fprint': fingerprint, 'imports': sorted(imports)}
+                self._cache_dirty = True
+        
+        # Forget files that were deleted since they were cached
+        for key in [key for key in cache if key not in seen]:
+            if not (self.project_path / key).exists():
+                del cache[key]
+                self._cache_dirty = True
+        
+        self._save_cache()
+        return used_imports
+    
+    def _uncached_files(self, files: Iterable[Path], cache: Dict[str, Dict[str, Any]],
+                        used_imports: Set[str], misses: List[Any],
+                        seen: Set[str]) -> Iterator[Path]:
+        """Yield files without a valid cache entry, adding cached imports of the rest."""
+        for file_path in files:
+            key = file_path.relative_to(self.project_path).as_posix()
+            seen.add(key)
+            try:
+                fingerprint = hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                fingerprint = None
+            
+            entry = cache.get(key)
+            if fingerprint and entry and entry.get('fprint') == fingerprint and 'imports' in entry:
+                used_imports.update(entry['imports'])
+                continue
+            
+            misses.append((file_path, key, fingerprint))
+            yield file_path
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the cache index from disk (once per cleaner)."""
+        if self._cache is None:
+            import json
+            
+            try:
+                with open(self._cache_dir / 'cache.json', 'r', encoding='utf-8') as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = None
+            
+            # Discard indexes written by another version (or not understood at all)
+            if not (isinstance(self._cache, dict) and self._cache.get('version') == CACHE_VERSION
+                    and isinstance(self._cache.get('extractors'), dict)):
+                self._cache = {'version': CACHE_VERSION, 'extractors': {}}
+        
+        return self._cache
+    
+    def _extractor_cache(self, extractor: Callable[[Path], Set[str]]) -> Dict[str, Dict[str, Any]]:
+        """Get the cache entries (by relative path) of one extractor."""
+        extractor_id = f"{extractor.__module__}.{extractor.__qualname__}"
+        return self._load_cache()['extractors'].setdefault(extractor_id, {})
+    
+    def _save_cache(self) -> None:
+        """Atomically write the cache index back to disk if it changed."""
+        if not self._cache_dirty:
+            return
+        
+        import json
+        
+        try:
+            self._cache_dir.mkdir(exist_ok=True)
+            gitignore_path = self._cache_dir / '.gitignore'
+            if not gitignore_path.exists():
+                # Keep the cache out of version control without touching the project's .gitignore
+                gitignore_path.write_text('# Created by cleancodezap automatically.\n*\n')
+            
+            tmp_path = self._cache_dir / 'cache.json.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f, sort_keys=True)
+            os.replace(tmp_path, self._cache_dir / 'cache.json')
+            self._cache_dirty = False
+        except OSError:
+            pass  # The cache is an optimization only
+    
     def _get_cleaning_stats(self, files: List[Path]) -> Dict[str, int]:
         """Get detailed cleaning statistics."""
         return {
@@ -7,10 +7,27 @@ import re
 import sys
 import shutil
 import subprocess
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict, Set
+from typing import (
+    Optional, List, Dict, Set, Tuple, Union, AbstractSet, Callable, Iterable, Iterator,
+    TYPE_CHECKING
+)
 import click
 
+if TYPE_CHECKING:
+    import mmap
+
+# ast, mmap and concurrent.futures are imported where they are used, so that
+# the CLI (which imports this module for its messages) starts without them
+
+try:
+    from ._scanners import go_import_spans, js_import_spans
+except ImportError:  # Compiled extension not built, use the regex fallbacks
+    go_import_spans = js_import_spans = None
+
 
 def print_success(message: str) -> None:
     """Print success message in green."""
@@ -32,6 +49,78 @@ def print_warning(message: str) -> None:
     click.echo(click.style(message, fg='yellow'))
 
 
+# Detected languages, indexed by the slot of their detection score
+PY, JS, GO = 0, 1, 2
+LANGUAGES = ('python', 'javascript', 'go')
+
+# Language indicators: exact file/directory names and file extensions
+_LANGUAGE_NAMES = {
+    PY: (
+        'requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile',
+        '__pycache__', '.python-version'
+    ),
+    JS: (
+        'package.json', 'package-lock.json', 'yarn.lock', 'node_modules', '.nvmrc'
+    ),
+    GO: ('go.mod', 'go.sum', 'main.go', 'vendor'),
+}
+_LANGUAGE_EXTENSIONS = {
+    PY: ('.py',),
+    JS: ('.js', '.ts', '.jsx', '.tsx'),
+    GO: ('.go',),
+}
+
+# (language slot, weight) of each indicator, so detection does one lookup per entry
+NAME_SCORES = {name: (lang, 3) for lang, names in _LANGUAGE_NAMES.items() for name in names}
+DIR_SCORES = {name: (lang, 2) for lang, names in _LANGUAGE_NAMES.items() for name in names}
+EXT_SCORES = {ext: (lang, 1) for lang, exts in _LANGUAGE_EXTENSIONS.items() for ext in exts}
+
+# Dependency, build and VCS directories: they still score as indicators, but
+# detection does not descend into them (their contents are not the project's code)
+_SKIP_DIRS = frozenset({
+    '__pycache__', 'node_modules', 'vendor', '.git', '.venv', 'venv', 'dist', 'build'
+})
+
+# Detection re-checks the scores every DETECT_CHECK_INTERVAL entries and stops
+# early when the leader is ahead by DETECT_DOMINANT_MARGIN, or at DETECT_MAX_ENTRIES
+DETECT_CHECK_INTERVAL = 512
+DETECT_DOMINANT_MARGIN = 50
+DETECT_MAX_ENTRIES = 20000
+
+# A parallel walk only pays off when the root fans out into more subdirectories
+PARALLEL_WALK_MIN_SUBDIRS = 4
+PARALLEL_WALK_MAX_WORKERS = 8
+
+# sendfile() accepts regular files as the output only on Linux
+_USE_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+
+# Source files at least this large are memory-mapped instead of read
+MMAP_SOURCE_MIN_SIZE = 2 * 1024 * 1024
+
+# Import patterns, compiled once instead of on every file. Sources are scanned
+# as raw bytes, so only the matched names get decoded
+_MODULE_NAME = rb'[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*'
+_PY_IMPORT_RE = re.compile(
+    rb'^\s*(?:import[ \t]+(' + _MODULE_NAME + rb')|from[ \t]+(' + _MODULE_NAME + rb')[ \t]+import)',
+    re.MULTILINE
+)
+# One pass for require('x'), import ... from 'x' and import 'x'. The import
+# clause is limited to names, braces, commas and '*' and stops at the next
+# 'import', so a run of clauses without 'from' is scanned once, not once per
+# 'import' up to the end of the run
+_JS_IMPORT_RE = re.compile(
+    rb'require\s*\(\s*[\'"]([^\'"\s]+)[\'"]\s*\)'
+    rb'|\bimport\b(?:(?!\bimport\b)[\w$*{},\s])*?\bfrom\s*[\'"]([^\'"\s]+)[\'"]'
+    rb'|\bimport\s*[\'"]([^\'"\s]+)[\'"]'
+)
+_GO_SINGLE_RE = re.compile(rb'import\s+"([^"]+)"')
+_GO_BLOCK_RE = re.compile(rb'import\s+\(([^)]+)\)', re.DOTALL)
+_GO_PATH_RE = re.compile(rb'"([^"]+)"')
+
+# AST fields holding nested statements (or except handlers / match cases)
+_STATEMENT_BLOCKS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
 def validate_project_path(path: Path) -> bool:
     """
     Validate that the given path exists and is accessible.
@@ -48,73 +137,149 @@ def validate_project_path(path: Path) -> bool:
         return False
 
 
-def detect_project_language(project_path: Path) -> Optional[str]:
+def detect_project_language(project_path: Path, workers: int = 1) -> Optional[str]:
     """
     Auto-detect the programming language of a project.
     
     Args:
         project_path: Path to the project directory
+        workers: Number of threads reading directories (1 walks serially)
         
     Returns:
         Detected language ('python', 'javascript', 'go') or None
     """
-    # Language indicators
-    indicators = {
-        'python': [
-            'requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile',
-            '*.py', '__pycache__', '.python-version'
-        ],
-        'javascript': [
-            'package.json', 'package-lock.json', 'yarn.lock', 'node_modules',
-            '*.js', '*.ts', '*.jsx', '*.tsx', '.nvmrc'
-        ],
-        'go': [
-            'go.mod', 'go.sum', 'main.go', '*.go', 'vendor'
-        ]
-    }
-    
-    scores = {'python': 0, 'javascript': 0, 'go': 0}
-    
-    # Check for specific files and directories
-    for item in project_path.rglob('*'):
-        if item.is_file():
-            for lang, patterns in indicators.items():
-                for pattern in patterns:
-                    if pattern.startswith('*.'):
-                        # File extension check
-                        if item.suffix == pattern[1:]:
-                            scores[lang] += 1
-                    elif item.name == pattern:
-                        # Exact filename match
-                        scores[lang] += 3
-        elif item.is_dir():
-            for lang, patterns in indicators.items():
-                for pattern in patterns:
-                    if item.name == pattern:
-                        scores[lang] += 2
+    scores = [0] * len(LANGUAGES)
+    
+    # Check for specific files and directories (unreadable directories are skipped),
+    # reading at most DETECT_MAX_ENTRIES of them
+    entries = islice(_walk_entries(project_path, _SKIP_DIRS, workers), DETECT_MAX_ENTRIES)
+    for count, entry in enumerate(entries, 1):
+        if count % DETECT_CHECK_INTERVAL == 0:
+            # Stop once one language clearly leads
+            first, second = sorted(scores, reverse=True)[:2]
+            if first - second > DETECT_DOMINANT_MARGIN:
+                break
+        
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            hits = (DIR_SCORES.get(name),)
+        else:
+            # A file may score both by exact name and by extension (dotfiles have none)
+            dot = name.rfind('.')
+            hits = (NAME_SCORES.get(name), EXT_SCORES.get(name[dot:]) if dot > 0 else None)
+        
+        for hit in hits:
+            if hit:
+                lang, weight = hit
+                scores[lang] += weight
     
     # Return language with highest score
-    if max(scores.values()) == 0:
-        return None
+    best = max(range(len(LANGUAGES)), key=scores.__getitem__)
+    return LANGUAGES[best] if scores[best] else None
+
+
+def _scan_dir(path: str, prune_dirs: Optional[AbstractSet[str]] = None
+              ) -> Tuple[List[os.DirEntry], List[str]]:
+    """Read one directory, returning its entries and the subdirectories to descend into."""
+    entries = []
+    subdirs = []
+    try:
+        with os.scandir(path) as listing:
+            for entry in listing:
+                entries.append(entry)
+                # Like os.walk, do not follow symlinked directories
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if not (prune_dirs and entry.name in prune_dirs):
+                    subdirs.append(entry.path)
+    except OSError:
+        pass  # Unreadable directory, skip it
     
-    return max(scores, key=scores.get)
+    return entries, subdirs
 
 
-def find_files_by_extension(project_path: Path, extensions: List[str]) -> List[Path]:
+def _walk_entries(root: Path, prune_dirs: Optional[AbstractSet[str]] = None,
+                  workers: int = 1) -> Iterator[os.DirEntry]:
+    """
+    Yield the directory entries of a tree, using the type info cached by scandir.
+    
+    Args:
+        root: Directory to walk
+        prune_dirs: Directory names that are yielded but not descended into
+        workers: Number of threads reading directories; more than one only
+            takes effect when the root has enough subdirectories
+        
+    Yields:
+        Directory entries (in no fixed order when walking in parallel)
+    """
+    entries, subdirs = _scan_dir(os.fspath(root), prune_dirs)
+    yield from entries
+    
+    if workers <= 1 or len(subdirs) <= PARALLEL_WALK_MIN_SUBDIRS:
+        # Explicit stack instead of recursion, so deep trees cost no Python frames
+        stack = subdirs[::-1]
+        while stack:
+            entries, subdirs = _scan_dir(stack.pop(), prune_dirs)
+            yield from entries
+            stack.extend(reversed(subdirs))
+        return
+    
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    
+    # scandir releases the GIL, so threads overlap directory reads
+    pool = ThreadPoolExecutor(max_workers=min(workers, PARALLEL_WALK_MAX_WORKERS))
+    pending = {pool.submit(_scan_dir, subdir, prune_dirs) for subdir in subdirs}
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                entries, subdirs = future.result()
+                pending.update(pool.submit(_scan_dir, subdir, prune_dirs) for subdir in subdirs)
+                yield from entries
+    finally:
+        # The caller may stop early; drop the directories not read yet
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
+
+
+def find_files_by_extension(project_path: Path, extensions: Iterable[str],
+                            prune_dirs: Optional[AbstractSet[str]] = None,
+                            workers: int = 1) -> List[Path]:
     """
     Find all files with given extensions in the project.
     
     Args:
         project_path: Path to search in
-        extensions: List of file extensions (e.g., ['.py', '.js'])
+        extensions: File extensions (e.g., ['.py', '.js'] or a set of them)
+        prune_dirs: Directory names that are not descended into
+        workers: Number of threads reading directories (1 walks serially)
         
     Returns:
         List of file paths
     """
-    files = []
-    for ext in extensions:
-        files.extend(project_path.rglob(f'*{ext}'))
-    return files
+    return list(iter_files_by_extension(project_path, extensions, prune_dirs, workers))
+
+
+def iter_files_by_extension(project_path: Path, extensions: Iterable[str],
+                            prune_dirs: Optional[AbstractSet[str]] = None,
+                            workers: int = 1) -> Iterator[Path]:
+    """
+    Yield files with given extensions as the project directory is walked.
+    
+    Args:
+        project_path: Path to search in
+        extensions: File extensions (e.g., ['.py', '.js'] or a set of them)
+        prune_dirs: Directory names that are not descended into
+        workers: Number of threads reading directories (1 walks serially)
+        
+    Yields:
+        File paths, in discovery order
+    """
+    suffixes = tuple(extensions)
+    for entry in _walk_entries(project_path, prune_dirs, workers):
+        if not entry.is_dir() and entry.name.endswith(suffixes):
+            yield Path(entry.path)
 
 
 def is_binary_file(file_path: Path) -> bool:
@@ -128,11 +293,28 @@ def is_binary_file(file_path: Path) -> bool:
         True if file is binary, False otherwise
     """
     try:
-        with open(file_path, 'rb') as f:
-            chunk = f.read(8192)
-            return b'\0' in chunk
-    except (OSError, PermissionError):
+        stat = os.stat(file_path)
+    except OSError:
+        return True
+    
+    # Repeated checks of an unchanged file are answered from the cache
+    return _is_binary_content(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _is_binary_content(path: str, mtime_ns: int, size: int) -> bool:
+    """Look for a NUL byte in the first 8 KiB of one version of a file."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    except OSError:
         return True
+    
+    try:
+        return b'\0' in os.read(fd, 8192)
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
 
 
 def run_command(command: List[str], cwd: Optional[Path] = None) -> Dict[str, any]:
@@ -147,25 +329,30 @@ def run_command(command: List[str], cwd: Optional[Path] = None) -> Dict[str, any
         Dictionary with 'success', 'stdout', 'stderr', 'returncode'
     """
     try:
-        result = subprocess.run(
+        # Capture raw bytes and decode each stream once at the end
+        with subprocess.Popen(
             command,
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=60  # 1 minute timeout
-        )
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        ) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=60)  # 1 minute timeout
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                return {
+                    'success': False,
+                    'stdout': '',
+                    'stderr': 'Command timed out',
+                    'returncode': -1
+                }
+        
         return {
-            'success': result.returncode == 0,
-            'stdout': result.stdout,
-            'stderr': result.stderr,
-            'returncode': result.returncode
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Command timed out',
-            'returncode': -1
+            'success': process.returncode == 0,
+            'stdout': stdout.decode('utf-8', errors='replace'),
+            'stderr': stderr.decode('utf-8', errors='replace'),
+            'returncode': process.returncode
         }
     except Exception as e:
         return {
@@ -176,10 +363,13 @@ def run_command(command: List[str], cwd: Optional[Path] = None) -> Dict[str, any
         }
 
 
+@lru_cache(maxsize=None)
 def check_tool_availability(tool: str) -> bool:
     """
     Check if a command-line tool is available.
     
+    The result is cached: PATH is searched once per tool and process.
+    
     Args:
         tool: Name of the tool to check
         
@@ -199,26 +389,47 @@ def extract_imports_from_python_file(file_path: Path) -> Set[str]:
     Returns:
         Set of imported module names
     """
-    imports = set()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Match import statements
-        import_patterns = [
-            r'^import\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)',
-            r'^from\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s+import',
-        ]
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            for pattern in import_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    module = match.group(1).split('.')[0]
-                    imports.add(module)
-    except (OSError, UnicodeDecodeError):
-        pass
+        with open(file_path, 'rb', buffering=0) as f:
+            source = f.read()
+    except OSError:
+        return set()
+    
+    import ast
+    
+    try:
+        # ast decodes the bytes itself, honouring any coding declaration
+        tree = ast.parse(source, filename=str(file_path))
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        # Not valid Python (yet), or too deeply nested for the parser: match import lines instead
+        return _extract_python_imports_by_regex(source)
+    
+    imports = set()
+    # Imports are statements, so follow nested statement blocks (if/try/def/class
+    # bodies and the like) and never descend into expressions
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            imports.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            # Relative imports (from . import x) are not dependencies
+            if node.module and node.level == 0:
+                imports.add(node.module.split('.')[0])
+        else:
+            for field in _STATEMENT_BLOCKS:
+                stack.extend(getattr(node, field, ()))
+    
+    return imports
+
+
+def _extract_python_imports_by_regex(source: bytes) -> Set[str]:
+    """Extract imported module names from Python source that does not parse."""
+    imports = set()
+    # One scan over the whole buffer instead of splitting it into lines
+    for match in _PY_IMPORT_RE.finditer(source):
+        module = (match.group(1) or match.group(2)).partition(b'.')[0]
+        imports.add(module.decode('ascii'))
     
     return imports
 
@@ -235,24 +446,25 @@ def extract_requires_from_js_file(file_path: Path) -> Set[str]:
     """
     requires = set()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Match require and import statements
-        patterns = [
-            r'require\s*\(\s*[\'"]([^\'"\s]+)[\'"]\s*\)',
-            r'import\s+.*?\s+from\s+[\'"]([^\'"\s]+)[\'"]',
-            r'import\s+[\'"]([^\'"\s]+)[\'"]',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
+        with _open_source(file_path) as content:
+            # Files without either keyword cannot match, skip the regex scan
+            if content.find(b'require') == -1 and content.find(b'import') == -1:
+                return requires
+            
+            # Match require and import statements
+            if js_import_spans is not None:
+                modules = [content[start:end] for start, end in js_import_spans(content)]
+            else:
+                modules = [
+                    match.group(match.lastindex) for match in _JS_IMPORT_RE.finditer(content)
+                ]
+            
+            for module in modules:
                 # Extract package name (before first slash)
-                package = match.split('/')[0]
-                if not package.startswith('.'):  # Skip relative imports
-                    requires.add(package)
-    except (OSError, UnicodeDecodeError):
+                package = module.split(b'/')[0]
+                if not package.startswith(b'.'):  # Skip relative imports
+                    requires.add(package.decode('utf-8', errors='replace'))
+    except (OSError, ValueError):
         pass
     
     return requires
@@ -270,39 +482,94 @@ def extract_imports_from_go_file(file_path: Path) -> Set[str]:
     """
     imports = set()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Match import statements
-        patterns = [
-            r'import\s+"([^"]+)"',
-            r'import\s+\(\s*([^)]+)\s*\)',
-        ]
-        
-        for pattern in patterns:
-            if 'import (' in content:
+        with _open_source(file_path) as content:
+            # Match import statements
+            if go_import_spans is not None:
+                paths = [content[start:end] for start, end in go_import_spans(content)]
+            elif content.find(b'import (') != -1:
                 # Multi-line import block
-                import_block = re.search(r'import\s+\(([^)]+)\)', content, re.DOTALL)
-                if import_block:
-                    lines = import_block.group(1).split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        match = re.search(r'"([^"]+)"', line)
-                        if match:
-                            package = match.group(1).split('/')[-1]
-                            imports.add(package)
+                import_block = _GO_BLOCK_RE.search(content)
+                paths = _GO_PATH_RE.findall(import_block.group(1)) if import_block else []
             else:
                 # Single import lines
-                matches = re.findall(r'import\s+"([^"]+)"', content)
-                for match in matches:
-                    package = match.split('/')[-1]
-                    imports.add(package)
-    except (OSError, UnicodeDecodeError):
+                paths = _GO_SINGLE_RE.findall(content)
+            
+            for path in paths:
+                package = path.rpartition(b'/')[2]
+                imports.add(package.decode('utf-8', errors='replace'))
+    except (OSError, ValueError):
         pass
     
     return imports
 
 
+# Import extractor of each supported language
+IMPORT_EXTRACTORS = {
+    'python': extract_imports_from_python_file,
+    'javascript': extract_requires_from_js_file,
+    'go': extract_imports_from_go_file,
+}
+
+
+def extract_imports_from_files(paths: Iterable[Path], kind: str = 'python',
+                               workers: int = 8) -> Set[str]:
+    """
+    Extract the imports of many files of one language.
+    
+    Args:
+        paths: Files to extract imports from
+        kind: Language of the files ('python', 'javascript', 'go')
+        workers: Number of threads reading files
+        
+    Returns:
+        Union of the imports of all files
+    """
+    imports = set()
+    for file_imports in extract_imports_per_file(list(paths), IMPORT_EXTRACTORS[kind], workers):
+        imports |= file_imports
+    
+    return imports
+
+
+def extract_imports_per_file(paths: List[Path], extractor: Callable[[Path], Set[str]],
+                             workers: int = 8) -> List[Set[str]]:
+    """
+    Extract the imports of each of many files.
+    
+    Runs the extractor on a thread pool. With the compiled scanners built,
+    the JS and Go extractors scan without the GIL, so files are scanned in
+    parallel as well as read.
+    
+    Args:
+        paths: Files to extract imports from
+        extractor: Function extracting the imports of one file
+        workers: Number of threads reading files
+        
+    Returns:
+        Imports of each file, in the order of paths
+    """
+    if workers <= 1 or len(paths) <= 1:
+        return [extractor(file_path) for file_path in paths]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # File reads (and the compiled scanners) release the GIL, so threads overlap
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(executor.map(extractor, paths))
+
+
+@contextmanager
+def _open_source(file_path: Path) -> Iterator[Union[bytes, 'mmap.mmap']]:
+    """Give the raw contents of a source file, memory-mapped when it is large."""
+    with open(file_path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < MMAP_SOURCE_MIN_SIZE:
+            yield f.read()
+        else:
+            import mmap
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
+
+
 def backup_file(file_path: Path, backup_dir: Path) -> Path:
     """
     Create a backup copy of a file.
@@ -314,15 +581,136 @@ def backup_file(file_path: Path, backup_dir: Path) -> Path:
     Returns:
         Path to the backup file
     """
-    backup_dir.mkdir(parents=True, exist_ok=True)
-    
     # Create relative path structure in backup
     relative_path = file_path.relative_to(file_path.parent.parent)
-    backup_path = backup_dir / relative_path
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    return backup_files([(file_path, relative_path)], backup_dir)[0]
+
+
+def backup_files(pairs: Iterable[Tuple[Path, Path]], backup_dir: Path) -> List[Path]:
+    """
+    Copy files into a backup directory, keeping their permissions and timestamps.
+    
+    Args:
+        pairs: (file to backup, path of its copy relative to backup_dir) pairs
+        backup_dir: Directory to store the backups
+        
+    Returns:
+        Paths to the backup files, in the order of pairs
+    """
+    targets = [(Path(source), backup_dir / relative) for source, relative in pairs]
     
-    shutil.copy2(file_path, backup_path)
-    return backup_path
+    # Create every needed directory once, parents before children
+    for directory in sorted({target.parent for _, target in targets} | {backup_dir}):
+        os.makedirs(directory, exist_ok=True)
+    
+    for source, target in targets:
+        _copy_file(source, target)
+    
+    return [target for _, target in targets]
+
+
+def _copy_file(source: Path, target: Path) -> None:
+    """Copy one file, in the kernel where sendfile allows it, then its mode and times."""
+    with open(source, 'rb') as fsrc, open(target, 'wb') as fdst:
+        stat = os.fstat(fsrc.fileno())
+        try:
+            if not _USE_SENDFILE:
+                raise OSError('sendfile is not used on this platform')
+            offset = 0
+            while offset < stat.st_size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, stat.st_size - offset)
+                if sent == 0:
+                    break  # The file shrank while being copied
+                offset += sent
+        except OSError:
+            # Filesystem or platform without sendfile between files
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    
+    os.chmod(target, stat.st_mode & 0o7777)
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+# .gitignore patterns for each language
+_GITIGNORE_TEMPLATES = {
+    'python': [
+        '__pycache__/',
+        '*.py[cod]',
+        '*$py.class',
+        '*.so',
+        '.Python',
+        'build/',
+        'develop-eggs/',
+        'dist/',
+        'downloads/',
+        'eggs/',
+        '.eggs/',
+        'lib/',
+        'lib64/',
+        'parts/',
+        'sdist/',
+        'var/',
+        'wheels/',
+        '*.egg-info/',
+        '.installed.cfg',
+        '*.egg',
+        'MANIFEST',
+        '.env',
+        '.venv',
+        'env/',
+        'venv/',
+        'ENV/',
+        'env.bak/',
+        'venv.bak/',
+        '.cleancodezap_cache/',
+    ],
+    'javascript': [
+        'node_modules/',
+        'npm-debug.log*',
+        'yarn-debug.log*',
+        'yarn-error.log*',
+        '.npm',
+        '.eslintcache',
+        '.nyc_output',
+        'coverage/',
+        '.grunt',
+        'bower_components',
+        '.lock-wscript',
+        'build/Release',
+        '.node_repl_history',
+        '*.tgz',
+        '.yarn-integrity',
+        '.env',
+        '.env.local',
+        '.env.development.local',
+        '.env.test.local',
+        '.env.production.local',
+        '.cleancodezap_cache/',
+    ],
+    'go': [
+        '*.exe',
+        '*.exe~',
+        '*.dll',
+        '*.so',
+        '*.dylib',
+        '*.test',
+        '*.out',
+        'go.work',
+        'vendor/',
+        '.cleancodezap_cache/',
+    ]
+}
+
+
+# Whole .gitignore files, rendered once so creating one is a single write
+_GITIGNORE_BLOBS = {
+    language: (
+        f"# {language.title()} .gitignore\n\n" + ''.join(f"{pattern}\n" for pattern in patterns)
+    ).encode('utf-8')
+    for language, patterns in _GITIGNORE_TEMPLATES.items()
+}
 
 
 def create_gitignore_if_missing(project_path: Path, language: str) -> None:
@@ -337,77 +725,10 @@ def create_gitignore_if_missing(project_path: Path, language: str) -> None:
     if gitignore_path.exists():
         return
     
-    templates = {
-        'python': [
-            '__pycache__/',
-            '*.py[cod]',
-            '*$py.class',
-            '*.so',
-            '.Python',
-            'build/',
-            'develop-eggs/',
-            'dist/',
-            'downloads/',
-            'eggs/',
-            '.eggs/',
-            'lib/',
-            'lib64/',
-            'parts/',
-            'sdist/',
-            'var/',
-            'wheels/',
-            '*.egg-info/',
-            '.installed.cfg',
-            '*.egg',
-            'MANIFEST',
-            '.env',
-            '.venv',
-            'env/',
-            'venv/',
-            'ENV/',
-            'env.bak/',
-            'venv.bak/',
-        ],
-        'javascript': [
-            'node_modules/',
-            'npm-debug.log*',
-            'yarn-debug.log*',
-            'yarn-error.log*',
-            '.npm',
-            '.eslintcache',
-            '.nyc_output',
-            'coverage/',
-            '.grunt',
-            'bower_components',
-            '.lock-wscript',
-            'build/Release',
-            '.node_repl_history',
-            '*.tgz',
-            '.yarn-integrity',
-            '.env',
-            '.env.local',
-            '.env.development.local',
-            '.env.test.local',
-            '.env.production.local',
-        ],
-        'go': [
-            '*.exe',
-            '*.exe~',
-            '*.dll',
-            '*.so',
-            '*.dylib',
-            '*.test',
-            '*.out',
-            'go.work',
-            'vendor/',
-        ]
-    }
-    
-    if language in templates:
+    blob = _GITIGNORE_BLOBS.get(language)
+    if blob:
         try:
-            with open(gitignore_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {language.title()} .gitignore\n\n")
-                for pattern in templates[language]:
-                    f.write(f"{pattern}\n")
+            with open(gitignore_path, 'wb') as f:
+                f.write(blob)
         except OSError:
             pass  # Ignore if we can't create the file 
\ No newline at end of file
@@ -3,11 +3,23 @@
 Setup configuration for CleanCodeZap - A CLI tool for cleaning and optimizing code.
 """
 
-from setuptools import setup, find_packages
+import os
+
+from setuptools import setup, find_packages, Extension
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional compiled scanners; CleanCodeZap falls back to pure Python without them.
+# Opt in with CLEANCODEZAP_BUILD_EXT=1 (Cython must be installed in the build environment)
+ext_modules = []
+if os.environ.get("CLEANCODEZAP_BUILD_EXT") == "1":
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("cleancodezap._scanners", ["cleancodezap/_scanners.pyx"], optional=True)],
+        language_level=3,
+    )
+
 setup(
     name="cleancodezap",
     version="1.0.0",
@@ -18,6 +30,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/E180w/CleanCodeZap",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
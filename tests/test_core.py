@@ -2,13 +2,41 @@
 Tests for CleanCodeZap core functionality.
 """
 
+import os
+import json
+import time
+import random
+import socket
+import urllib.request
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 
-from cleancodezap.core import CodeCleaner
-from cleancodezap.utils import detect_project_language, validate_project_path
+from cleancodezap.core import (
+    CACHE_VERSION,
+    PROCESS_POOL_MIN_FILES,
+    _COMMENTED_CODE_RE,
+    CodeCleaner,
+)
+from cleancodezap.utils import (
+    DETECT_CHECK_INTERVAL,
+    PARALLEL_WALK_MIN_SUBDIRS,
+    _GO_BLOCK_RE,
+    _GO_PATH_RE,
+    _GO_SINGLE_RE,
+    _JS_IMPORT_RE,
+    _walk_entries,
+    backup_files,
+    detect_project_language,
+    validate_project_path,
+    extract_imports_from_files,
+    extract_imports_from_go_file,
+    extract_imports_from_python_file,
+    extract_requires_from_js_file,
+    find_files_by_extension,
+    is_binary_file,
+)
 
 
 class TestCodeCleaner:
@@ -61,6 +89,29 @@ class TestCodeCleaner:
         assert cleaner.project_path == self.temp_dir
         assert cleaner.language == "python"
         assert cleaner.backup_dir is None
+        assert cleaner.jobs >= 1
+    
+    def test_parallel_files_preserves_order(self):
+        """Test that parallel per-file processing keeps input order."""
+        files = [self.temp_dir / f"file_{i}.py" for i in range(20)]
+        
+        cleaner = CodeCleaner(self.temp_dir, "python", jobs=4)
+        assert cleaner._parallel_files(files, lambda p: p.name) == [p.name for p in files]
+        
+        cleaner = CodeCleaner(self.temp_dir, "python", jobs=1)
+        assert cleaner._parallel_files(files, lambda p: p.name) == [p.name for p in files]
+    
+    def test_chunk_files(self):
+        """Test splitting files into tool invocation batches."""
+        files = [self.temp_dir / f"file_{i}.py" for i in range(10)]
+        
+        cleaner = CodeCleaner(self.temp_dir, "python", jobs=3)
+        chunks = cleaner._chunk_files(files)
+        assert len(chunks) == 3
+        assert [f for chunk in chunks for f in chunk] == files
+        
+        cleaner = CodeCleaner(self.temp_dir, "python", jobs=1)
+        assert cleaner._chunk_files(files) == [files]
     
     def test_analyze_empty_project(self):
         """Test analyzing an empty project."""
@@ -102,6 +153,64 @@ if __name__ == "__main__":
         assert (backup_path / "test.py").exists()
         assert (backup_path / "requirements.txt").exists()
     
+    def test_backup_isolated_from_changes(self):
+        """Test that rewriting project files does not alter the backup."""
+        (self.temp_dir / "test.py").write_text("print('hello')")
+        (self.temp_dir / "data").mkdir()
+        (self.temp_dir / "data" / "notes.txt").write_text("notes")
+        (self.temp_dir / "__pycache__").mkdir()
+        (self.temp_dir / "__pycache__" / "test.cpython-311.pyc").write_bytes(b"\0")
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        backup_path = cleaner.create_backup()
+        try:
+            (self.temp_dir / "test.py").write_text("print('changed')")
+            
+            assert (backup_path / "test.py").read_text() == "print('hello')"
+            assert (backup_path / "data" / "notes.txt").read_text() == "notes"
+            assert not (backup_path / "__pycache__").exists()
+        finally:
+            shutil.rmtree(backup_path)
+    
+    def test_backup_keeps_directory_metadata(self):
+        """Test that backup directories keep the permissions and timestamps of the originals."""
+        data_dir = self.temp_dir / "data"
+        (data_dir / "nested").mkdir(parents=True)
+        (data_dir / "nested" / "notes.txt").write_text("notes")
+        (data_dir / "test.py").write_text("print('hello')")
+        data_dir.chmod(0o750)
+        for directory in (data_dir / "nested", data_dir):
+            os.utime(directory, ns=(10 ** 9, 2 * 10 ** 9))
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        backup_path = cleaner.create_backup()
+        try:
+            for directory in ("data", "data/nested"):
+                backup_stat = (backup_path / directory).stat()
+                assert backup_stat.st_mtime_ns == 2 * 10 ** 9
+                assert backup_stat.st_mode == (self.temp_dir / directory).stat().st_mode
+            assert (backup_path / "data").stat().st_mode & 0o777 == 0o750
+        finally:
+            shutil.rmtree(backup_path)
+    
+    def test_backup_files_keep_metadata(self):
+        """Test that backup copies keep content, permissions and timestamps."""
+        script = self.temp_dir / "bin" / "run.py"
+        script.parent.mkdir()
+        script.write_text("print('hello')\n")
+        script.chmod(0o750)
+        os.utime(script, ns=(10 ** 9, 2 * 10 ** 9))
+        
+        backup_dir = self.temp_dir.parent / f"{self.temp_dir.name}_backup"
+        try:
+            copies = backup_files([(script, Path("bin") / "run.py")], backup_dir)
+            assert copies == [backup_dir / "bin" / "run.py"]
+            assert copies[0].read_text() == "print('hello')\n"
+            assert copies[0].stat().st_mode & 0o777 == 0o750
+            assert copies[0].stat().st_mtime_ns == 2 * 10 ** 9
+        finally:
+            shutil.rmtree(backup_dir, ignore_errors=True)
+    
     def test_find_code_files(self):
         """Test finding code files."""
         # Create mixed files
@@ -128,6 +237,100 @@ if __name__ == "__main__":
         assert len(files) == 1
         assert files[0].name == "main.go"
     
+    def test_code_files_cached(self):
+        """Test that the project is walked once per cleaner until invalidated."""
+        (self.temp_dir / "a.py").touch()
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        assert len(cleaner._get_code_files()) == 1
+        
+        (self.temp_dir / "b.py").touch()
+        assert len(cleaner._get_code_files()) == 1
+        
+        cleaner._invalidate_code_files()
+        assert len(cleaner._get_code_files()) == 2
+    
+    def test_find_code_files_skips_ignored_dirs(self):
+        """Test that ignored directories are not searched for code files."""
+        (self.temp_dir / "app.js").touch()
+        (self.temp_dir / "node_modules" / "lib").mkdir(parents=True)
+        (self.temp_dir / "node_modules" / "lib" / "index.js").touch()
+        (self.temp_dir / "src" / "node_modules").mkdir(parents=True)
+        (self.temp_dir / "src" / "node_modules" / "dep.js").touch()
+        
+        cleaner = CodeCleaner(self.temp_dir, "javascript")
+        files = cleaner._get_code_files()
+        assert [f.name for f in files] == ["app.js"]
+    
+    def test_binary_check_follows_changes(self):
+        """Test that a cached binary check is redone once the file changes."""
+        data_file = self.temp_dir / "data.py"
+        data_file.write_bytes(b"print('ok')\n")
+        assert not is_binary_file(data_file)
+        
+        data_file.write_bytes(b"\0\1\2\3" * 4)
+        os.utime(data_file, ns=(0, 10 ** 9))
+        assert is_binary_file(data_file)
+    
+    def test_find_commented_code(self):
+        """Test detection of commented-out code."""
+        commented = self.temp_dir / "commented.py"
+        commented.write_text("# x = 1\n    # print(x)\n#foo(bar)\nprint('ok')\n")
+        prose = self.temp_dir / "prose.py"
+        prose.write_text("# Just a comment\n# Another one\n# And a third\n")
+        empty = self.temp_dir / "empty.py"
+        empty.touch()
+        
+        large = self.temp_dir / "large.py"
+        large.write_text("print('padding')\n" * 5000 + "# a = 1\n# b = 2\n# c(3)\n")
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        assert cleaner._find_commented_code([commented, prose, empty, large]) == [commented, large]
+    
+    def test_compiled_scanner_matches_regex(self):
+        """Test that the optional compiled scanner agrees with the regex fallback."""
+        scanners = pytest.importorskip("cleancodezap._scanners")
+        
+        content = b"# x = 1\n  #\tfoo(bar)\n# prose only\n//a=b\n#_[\n  code = 1  # y = 2\n"
+        for lang, marker in (("python", b"#"), ("go", b"//")):
+            expected = len(_COMMENTED_CODE_RE[lang].findall(content))
+            assert scanners.count_commented_lines(content, marker) == expected
+        assert scanners.count_commented_lines(content, b"#", 2) == 2
+    
+    @pytest.mark.skipif(shutil.which("blackd") is None, reason="blackd not installed")
+    def test_blackd_check_and_format(self, monkeypatch):
+        """Test checking and formatting through blackd, bypassing HTTP proxies."""
+        # A proxy that refuses connections must not be used for the local server
+        monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+        monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+        
+        py_file = self.temp_dir / "main.py"
+        py_file.write_text("x = { 'a':1 }\n")
+        (self.temp_dir / "ok.py").write_text("y = 1\n")
+        
+        cleaner = CodeCleaner(self.temp_dir, "python", use_daemons=True)
+        assert cleaner._check_formatting(cleaner._get_code_files()) == [py_file]
+        assert cleaner.format_code()['files_formatted'] == 1
+        assert py_file.read_text() == 'x = {"a": 1}\n'
+    
+    @pytest.mark.skipif(shutil.which("black") is None, reason="black not installed")
+    def test_format_falls_back_when_blackd_is_gone(self):
+        """Test that files blackd could not reach are formatted with the black CLI."""
+        py_file = self.temp_dir / "main.py"
+        py_file.write_text("x = { 'a':1 }\n")
+        
+        # Pretend blackd was started on a port where nothing listens any more
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        cleaner = CodeCleaner(self.temp_dir, "python", use_daemons=True)
+        cleaner._blackd_started = True
+        cleaner._blackd_url = f"http://127.0.0.1:{port}/"
+        cleaner._blackd_opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+        
+        assert cleaner.format_code()['files_formatted'] == 1
+        assert py_file.read_text() == 'x = {"a": 1}\n'
+    
     def test_clean_empty_project(self):
         """Test cleaning an empty project."""
         cleaner = CodeCleaner(self.temp_dir, "python")
@@ -182,6 +385,90 @@ def main():
         assert results['dependency_file'] == str(req_file)
         # Should detect unused packages (but this depends on import analysis)
         assert isinstance(results['unused_dependencies'], list)
+    
+    def test_remove_unused_python_dependencies(self):
+        """Test removing unused requirements with various version specifiers."""
+        req_file = self.temp_dir / "requirements.txt"
+        req_file.write_text("requests>=2.25.0\nnumpy~=1.21\nclick!=8.0.0\n")
+        (self.temp_dir / "main.py").write_text("import requests\n")
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        results = cleaner.analyze_dependencies(remove_unused=True)
+        
+        assert sorted(results['unused_dependencies']) == ["click", "numpy"]
+        assert req_file.read_text() == "requests>=2.25.0\n"
+    
+    def test_import_cache_reuse(self):
+        """Test that extracted imports are cached by file content."""
+        (self.temp_dir / "requirements.txt").write_text("requests\n")
+        py_file = self.temp_dir / "main.py"
+        py_file.write_text("import requests\n")
+        
+        CodeCleaner(self.temp_dir, "python").analyze_dependencies()
+        assert (self.temp_dir / ".cleancodezap_cache" / "cache.json").exists()
+        
+        assert (self.temp_dir / ".cleancodezap_cache" / ".gitignore").read_text().endswith("*\n")
+        
+        calls = []
+        
+        def extractor(file_path):
+            calls.append(file_path)
+            return {"tracked"}
+        
+        # Entries of another extractor are never reused
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        assert cleaner._collect_imports([py_file], extractor) == {"tracked"}
+        assert calls == [py_file]
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        assert cleaner._collect_imports([py_file], extractor) == {"tracked"}
+        assert calls == [py_file]
+        
+        py_file.write_text("import os\n")
+        assert cleaner._collect_imports([py_file], extractor) == {"tracked"}
+        assert calls == [py_file, py_file]
+    
+    def test_import_cache_invalidation(self):
+        """Test that outdated cache indexes and entries of deleted files are dropped."""
+        py_file = self.temp_dir / "main.py"
+        py_file.write_text("import os, requests\n")
+        old_file = self.temp_dir / "old.py"
+        old_file.write_text("import yaml\n")
+        
+        # An index from an older release, where the file's imports were different
+        cache_dir = self.temp_dir / ".cleancodezap_cache"
+        cache_dir.mkdir()
+        (cache_dir / "cache.json").write_text(json.dumps({
+            "main.py": {"fprint": "stale", "imports": ["os"]},
+        }))
+        
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        imports = cleaner._collect_imports([py_file, old_file], extract_imports_from_python_file)
+        assert imports == {"os", "requests", "yaml"}
+        
+        old_file.unlink()
+        cleaner = CodeCleaner(self.temp_dir, "python")
+        imports = cleaner._collect_imports([py_file], extract_imports_from_python_file)
+        assert imports == {"os", "requests"}
+        
+        index = json.loads((cache_dir / "cache.json").read_text())
+        assert index["version"] == CACHE_VERSION
+        (entries,) = index["extractors"].values()
+        assert set(entries) == {"main.py"}
+    
+    def test_collect_imports_process_pool(self):
+        """Test collecting imports from a lazy walk large enough for worker processes."""
+        files = []
+        for i in range(PROCESS_POOL_MIN_FILES):
+            py_file = self.temp_dir / f"mod_{i}.py"
+            py_file.write_text(f"import pkg_{i}\n")
+            files.append(py_file)
+        
+        cleaner = CodeCleaner(self.temp_dir, "python", jobs=2)
+        imports = cleaner._collect_imports(
+            iter(files), extract_imports_from_python_file, use_processes=True
+        )
+        assert imports == {f"pkg_{i}" for i in range(PROCESS_POOL_MIN_FILES)}
 
 
 class TestProjectDetection:
@@ -229,6 +516,204 @@ class TestProjectDetection:
         
         language = detect_project_language(self.temp_dir)
         assert language == "python"
+    
+    def _count_walked_entries(self, monkeypatch):
+        """Make the detection walk record how many entries it hands out."""
+        pulled = []
+        
+        def counting_walk(*args, **kwargs):
+            for entry in _walk_entries(*args, **kwargs):
+                pulled.append(entry.name)
+                yield entry
+        
+        monkeypatch.setattr("cleancodezap.utils._walk_entries", counting_walk)
+        return pulled
+    
+    def test_large_project_detection(self, monkeypatch):
+        """Test detection stops early on a project dominated by one language."""
+        total = DETECT_CHECK_INTERVAL * 4
+        for i in range(total - 1):
+            (self.temp_dir / f"mod_{i}.py").touch()
+        (self.temp_dir / "package.json").touch()
+        
+        pulled = self._count_walked_entries(monkeypatch)
+        language = detect_project_language(self.temp_dir)
+        assert language == "python"
+        assert len(pulled) < total
+    
+    def test_detection_entry_cap(self, monkeypatch):
+        """Test detection reads exactly DETECT_MAX_ENTRIES entries of a tree without indicators."""
+        # Not a multiple of DETECT_CHECK_INTERVAL, so the cap must hold between checks
+        cap = DETECT_CHECK_INTERVAL * 2 + 100
+        monkeypatch.setattr("cleancodezap.utils.DETECT_MAX_ENTRIES", cap)
+        for i in range(cap + DETECT_CHECK_INTERVAL):
+            (self.temp_dir / f"data_{i}.txt").touch()
+        
+        pulled = self._count_walked_entries(monkeypatch)
+        assert detect_project_language(self.temp_dir) is None
+        assert len(pulled) == cap
+    
+    def test_parallel_walk_matches_serial(self):
+        """Test that a threaded walk finds the same files as a serial one."""
+        for i in range(PARALLEL_WALK_MIN_SUBDIRS + 2):
+            sub_dir = self.temp_dir / f"pkg_{i}" / "nested"
+            sub_dir.mkdir(parents=True)
+            (sub_dir / "mod.py").touch()
+            (sub_dir / "notes.txt").touch()
+        
+        serial = find_files_by_extension(self.temp_dir, ['.py'])
+        parallel = find_files_by_extension(self.temp_dir, ['.py'], workers=4)
+        assert len(serial) == PARALLEL_WALK_MIN_SUBDIRS + 2
+        assert sorted(parallel) == sorted(serial)
+        assert detect_project_language(self.temp_dir, workers=4) == "python"
+    
+    def test_dependency_dirs_not_scanned(self):
+        """Test that files inside node_modules do not outweigh the project's own code."""
+        (self.temp_dir / "app.py").touch()
+        (self.temp_dir / "requirements.txt").touch()
+        modules_dir = self.temp_dir / "node_modules" / "lodash"
+        modules_dir.mkdir(parents=True)
+        for i in range(20):
+            (modules_dir / f"mod_{i}.js").touch()
+        
+        language = detect_project_language(self.temp_dir)
+        assert language == "python"
+
+
+class TestImportExtraction:
+    """Test extraction of imports from source files."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+    
+    def test_python_imports(self):
+        """Test multi-line, nested and relative Python imports."""
+        py_file = self.temp_dir / "main.py"
+        py_file.write_text(
+            "import os.path, json\n"
+            "from requests import (\n"
+            "    get,\n"
+            "    post,\n"
+            ")\n"
+            "from . import sibling\n"
+            'HELP = """\n'
+            "import not_a_module\n"
+            '"""\n'
+            "def load():\n"
+            "    import yaml\n"
+        )
+        
+        imports = extract_imports_from_python_file(py_file)
+        assert imports == {"os", "json", "requests", "yaml"}
+    
+    def test_python_imports_invalid_syntax(self):
+        """Test that files that do not parse still report their imports."""
+        py_file = self.temp_dir / "broken.py"
+        py_file.write_text("import requests\nfrom flask import Flask\ndef broken(:\n")
+        
+        imports = extract_imports_from_python_file(py_file)
+        assert imports == {"requests", "flask"}
+    
+    def test_python_imports_deeply_nested(self):
+        """Test that valid source too deep for the AST parser still reports its imports."""
+        py_file = self.temp_dir / "generated.py"
+        py_file.write_text("import requests\nVALUE = " + " + ".join(["'x'"] * 5000) + "\n")
+        
+        imports = extract_imports_from_python_file(py_file)
+        assert imports == {"requests"}
+    
+    def test_js_imports(self):
+        """Test require calls, import forms and relative imports in JS."""
+        js_file = self.temp_dir / "index.js"
+        js_file.write_text(
+            "const _ = require('lodash/fp');\n"
+            "import React, { useState } from 'react';\n"
+            "import * as path from \"path\";\n"
+            "import 'core-js/stable';\n"
+            "import helper from './helper';\n"
+            "var a=1;import{b as c}from\"left-pad\";\n"
+        )
+        
+        requires = extract_requires_from_js_file(js_file)
+        assert requires == {"lodash", "react", "path", "core-js", "left-pad"}
+    
+    def test_js_imports_linear_time(self):
+        """Test that clauses without 'from' and long blank runs are scanned in linear time."""
+        js_file = self.temp_dir / "bundle.js"
+        js_file.write_bytes(
+            b"import a, " * 20000 + b"import" + b" " * 20000 + b"x;\nimport b from 'lodash';\n"
+        )
+        
+        start = time.perf_counter()
+        requires = extract_requires_from_js_file(js_file)
+        # A quadratic rescan takes over a minute here
+        assert time.perf_counter() - start < 2
+        assert requires == {"lodash"}
+    
+    def test_go_imports(self):
+        """Test Go import blocks and single import lines."""
+        block_file = self.temp_dir / "main.go"
+        block_file.write_text(
+            'package main\n\nimport (\n\t"fmt"\n\tlog "github.com/sirupsen/logrus"\n)\n'
+        )
+        single_file = self.temp_dir / "util.go"
+        single_file.write_text('package main\n\nimport "os"\nimport "net/http"\n')
+        
+        assert extract_imports_from_go_file(block_file) == {"fmt", "logrus"}
+        assert extract_imports_from_go_file(single_file) == {"os", "http"}
+    
+    def test_imports_from_many_files(self):
+        """Test collecting the imports of several files at once."""
+        paths = []
+        for i, source in enumerate(["import os\n", "from json import dumps\n", "import os\n"]):
+            py_file = self.temp_dir / f"mod_{i}.py"
+            py_file.write_text(source)
+            paths.append(py_file)
+        
+        assert extract_imports_from_files(paths, workers=2) == {"os", "json"}
+    
+    def test_compiled_import_scanners_match_regex(self):
+        """Test that the optional compiled import scanners agree with the regex fallbacks."""
+        scanners = pytest.importorskip("cleancodezap._scanners")
+        
+        def js_spans(content):
+            return [match.span(match.lastindex) for match in _JS_IMPORT_RE.finditer(content)]
+        
+        def go_spans(content):
+            if content.find(b"import (") == -1:
+                return [match.span(1) for match in _GO_SINGLE_RE.finditer(content)]
+            block = _GO_BLOCK_RE.search(content)
+            if not block:
+                return []
+            offset = block.start(1)
+            return [(offset + match.start(1), offset + match.end(1))
+                    for match in _GO_PATH_RE.finditer(block.group(1))]
+        
+        js_tokens = [b"import", b"from", b"require", b"(", b")", b" ", b"\n", b"{", b"}", b",",
+                     b"*", b"a", b"$", b"'x'", b'"y"', b"'", b'"', b"/", b";", b"importa", b"_"]
+        go_tokens = [b"import", b"import (", b" ", b"\n", b"(", b")", b'"', b'"fmt"', b'"a/b"',
+                     b"x", b'""']
+        samples = [(b"", b""), (
+            b"const _ = require('lodash/fp');\nimport React, { useState } from 'react';\n"
+            b"import 'core-js/stable';\nvar a=1;import{b as c}from\"left-pad\";\n",
+            b'package main\n\nimport (\n\t"fmt"\n\tlog "github.com/sirupsen/logrus"\n)\n',
+        )]
+        rng = random.Random(0)
+        for _ in range(20000):
+            samples.append((
+                b"".join(rng.choice(js_tokens) for _ in range(rng.randint(1, 16))),
+                b"".join(rng.choice(go_tokens) for _ in range(rng.randint(1, 16))),
+            ))
+        
+        for js_content, go_content in samples:
+            assert scanners.js_import_spans(js_content) == js_spans(js_content), js_content
+            assert scanners.go_import_spans(go_content) == go_spans(go_content), go_content
 
 
 if __name__ == "__main__":